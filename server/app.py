@@ -1,5 +1,5 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 import tempfile
@@ -12,7 +12,11 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Legal Document Analyzer", version="1.0.0")
+app = FastAPI(
+    title="Legal Document Analyzer",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -35,17 +39,36 @@ async def analyze_legal_pdf(file: UploadFile = File(...)):
     temp_file_path = None
     try:
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
+            # Record the path up front so the finally block can clean up
+            # even when the upload is rejected or aborted mid-stream.
             temp_file_path = temp_file.name
+            # Stream the upload to disk in 1 MiB chunks instead of buffering
+            # the whole file in memory first. The magic-byte check on the
+            # first chunk rejects mislabeled files before MuPDF is invoked.
+            first_chunk = True
+            while chunk := await file.read(1 << 20):
+                if first_chunk:
+                    if not chunk.startswith(b"%PDF-"):
+                        raise HTTPException(
+                            status_code=400, detail="File is not a valid PDF"
+                        )
+                    first_chunk = False
+                temp_file.write(chunk)
+            if first_chunk:
+                # The loop never ran: the upload was empty.
+                raise HTTPException(
+                    status_code=400, detail="File is not a valid PDF"
+                )
 
         result = await process_legal_document(temp_file_path)
-        return JSONResponse(content=result)
+        return ORJSONResponse(result)
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
-        logger.error(f"Processing error: {e}")
+        logger.error("Processing error: %s", e)
         raise HTTPException(status_code=500, detail="Processing failed")
 
     finally:
@@ -53,9 +76,13 @@ async def analyze_legal_pdf(file: UploadFile = File(...)):
             os.unlink(temp_file_path)
 
 
+# Built once at import; the health check payload never changes.
+_ROOT_RESPONSE = {"message": "Legal Document Analyzer", "status": "running"}
+
+
 @app.get("/")
 async def root():
-    return {"message": "Legal Document Analyzer", "status": "running"}
+    return _ROOT_RESPONSE
 
 
 if __name__ == "__main__":